@@ -17,154 +17,570 @@ PyMuPDF를 사용하여 PDF 내 이미지 오브젝트의 위치를 파악하고
 
     # DPI 지정
     python3 extract_images.py input.pdf -o output_dir --dpi 200
+
+    # 병렬 워커 수 지정 (여러 PDF 처리 시)
+    python3 extract_images.py --all --workers 8
 """
 
 import argparse
-import configparser
-import glob
+import functools
 import os
 import re
-import subprocess
+import struct
 import sys
+import zlib
+from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
 
 import fitz  # PyMuPDF
 
 
+# config.sh 해석용: NAME=value 대입문과 ${NAME:-default} / $NAME 확장
+_ASSIGN_RE = re.compile(
+    r'^(?:export\s+)?([A-Za-z_][A-Za-z0-9_]*)='
+    r'("(?:[^"\\]|\\.)*"|\'[^\']*\'|[^\s#]*)'
+)
+_PARAM_RE = re.compile(
+    r'\$\{([A-Za-z_][A-Za-z0-9_]*)(?::-((?:[^{}]|\{[^{}]*\})*))?\}'
+    r'|\$([A-Za-z_][A-Za-z0-9_]*)'
+)
+CONFIG_KEYS = ("PDF_DIR", "MD_DIR", "IMG_DIR")
+
+
+def _expand(value, env):
+    """셸 대입문 우변을 env 기준으로 확장한다 (config.sh에서 쓰는 문법만 지원)."""
+    if value.startswith("'"):
+        return value[1:-1]
+    if value.startswith('"'):
+        value = re.sub(r'\\(.)', r'\1', value[1:-1])
+
+    def repl(m):
+        name = m.group(1) or m.group(3)
+        current = env.get(name, "")
+        if m.group(2) is not None and not current:
+            return _expand(m.group(2), env)
+        return current
+
+    return _PARAM_RE.sub(repl, value)
+
+
+def _read_assignments(path, env, keys=None):
+    """셸 스크립트의 최상위 대입문을 순서대로 env에 반영한다."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            m = _ASSIGN_RE.match(line)
+            if m and (keys is None or m.group(1) in keys):
+                env[m.group(1)] = _expand(m.group(2), env)
+
+
 def load_config():
-    """config.sh에서 경로 설정을 로드한다."""
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    config_sh = os.path.join(script_dir, "..", "config.sh")
+    """config.sh에서 경로 설정을 로드한다.
+
+    bash를 띄우지 않고 config.sh와 동일한 우선순위로 해석한다:
+    pdf-queue.env 파일 > 환경 변수 > config.sh 기본값.
+    (config.sh가 env 파일을 set -a; source로 읽으므로 파일의 대입이 같은 이름의
+    환경 변수를 덮어쓰고, config.sh 기본값은 ${NAME:-...}로 비어 있을 때만 적용된다.)
+    """
+    config_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+    config_sh = os.path.join(config_dir, "config.sh")
+    if not os.path.exists(config_sh):
+        return {}
+
+    env = dict(os.environ)
+    env["PROJECT_DIR"] = env.get("CLAUDE_PROJECT_DIR") or os.path.abspath(
+        os.path.join(config_dir, "..", "..", "..", "..")
+    )
+
+    try:
+        for envfile in (
+            os.path.join(env["PROJECT_DIR"], ".claude", "pdf-queue.env"),
+            os.path.join(env["PROJECT_DIR"], ".env.pdf-queue"),
+        ):
+            if os.path.isfile(envfile):
+                _read_assignments(envfile, env)
+                break
+        _read_assignments(config_sh, env, keys=CONFIG_KEYS)
+    except (OSError, UnicodeDecodeError):
+        return {}
+
+    return {key: env[key] for key in CONFIG_KEYS if key in env}
+
+
+# 캡션 패턴 ("그림 1.2.3 설명") 및 파일명 금지 문자
+_CAPTION_RE = re.compile(r'그림\s*(\d+[\.\-]\d+[\.\-]\d+)\s*(.*)')
+_SANITIZE_RE = re.compile(r'[/\\:*?"<>|\n\r]')
+
+# 워커 프로세스 1개 작업당 페이지 수 (작업 전달/결과 피클링 비용 분산)
+PAGES_PER_TASK = 4
+
+# 적응형 DPI: 그룹 내 래스터 원본 해상도의 1.5배까지만 렌더링 (벡터 가독성 위해 하한 150)
+ADAPTIVE_DPI_HEADROOM = 1.5
+MIN_ADAPTIVE_DPI = 150
+
+# --colorspace auto: 그레이스케일 판별용 저해상도(36dpi) 샘플 렌더링 행렬
+COLORSPACES = ("rgb", "gray", "auto")
+GRAY_PROBE_MATRIX = fitz.Matrix(0.5, 0.5)
+
+# PNG 인코딩 zlib 압축 레벨 (MuPDF 기본 인코더보다 빠르고 파일은 다소 큼)
+DEFAULT_PNG_LEVEL = 1
+# Pixmap 채널 수(n) -> PNG 색 형식 (0: Gray, 2: RGB)
+# 알파 채널은 없음: MuPDF 샘플은 premultiplied라 PNG(straight alpha)로 그대로 쓸 수 없음
+_PNG_COLOR_TYPES = {1: 0, 3: 2}
+# 샘플을 변환 없이 PNG로 쓸 수 있는 원본 이미지 색공간
+_PNG_COLORSPACES = ("DeviceGray", "DeviceRGB")
+
+# 같은 이미지가 같은 위치로 전체 페이지의 30% 초과에 반복되면 머리글/바닥글로 간주
+# (본문 그림의 재사용과 구분하기 위해 페이지 위/아래 15% 띠에 놓인 경우만)
+RECURRING_PAGE_RATIO = 0.3
+HEADER_FOOTER_BAND = 0.15
+
+
+class ImageRect(namedtuple("ImageRect", "x0 y0 x1 y1 xref smask px_width px_height stacked",
+                           defaults=(False,))):
+    """페이지 내 이미지 배치 위치(pt)와 원본 래스터 정보
+
+    stacked: 같은 위치에 다른 이미지가 겹쳐 있어 하나로 합쳐진 rect
+    """
+
+    __slots__ = ()
+
+    @property
+    def area(self):
+        return (self.x1 - self.x0) * (self.y1 - self.y0)
+
+
+def _footprint(rect):
+    """xref와 pt 단위로 반올림한 위치로 만든 키 (페이지 간 동일 배치 비교용)"""
+    return (rect.xref, round(rect.x0), round(rect.y0), round(rect.x1), round(rect.y1))
+
+
+def _collect_image_rects(page, min_area):
+    """페이지 내 이미지 위치(ImageRect) 수집 (로고 크기 제외).
+
+    같은 xref가 여러 이름으로 등록된 경우(타일 배경 등) get_image_rects는
+    xref당 한 번만 호출한다. 같은 위치(0.1pt 단위)에 겹쳐 그려진 rect는 하나만
+    남기되, 서로 다른 이미지이면 원본 픽셀 수가 가장 큰 것을 남기고 stacked로
+    표시한다 (어느 층이 보이는지 알 수 없으므로 원본 이미지 저장 대상에서 제외).
+    """
+    rects = {}
+    seen_xrefs = set()
+    for img in page.get_images(full=True):
+        xref, smask, px_width, px_height = img[:4]
+        if xref in seen_xrefs:
+            continue
+        seen_xrefs.add(xref)
+        for r in page.get_image_rects(xref):
+            if r.width * r.height >= min_area:
+                key = (round(r.x0, 1), round(r.y0, 1), round(r.x1, 1), round(r.y1, 1))
+                prev = rects.get(key)
+                if prev is None:
+                    rects[key] = ImageRect(r.x0, r.y0, r.x1, r.y1,
+                                           xref, smask, px_width, px_height)
+                elif prev.xref != xref:
+                    if px_width * px_height > prev.px_width * prev.px_height:
+                        rects[key] = ImageRect(r.x0, r.y0, r.x1, r.y1,
+                                               xref, smask, px_width, px_height, True)
+                    elif not prev.stacked:
+                        rects[key] = prev._replace(stacked=True)
+    return list(rects.values())
+
+
+def _find_recurring_logos(page_rects, page_heights):
+    """여러 페이지에 같은 위치로 반복되는 머리글/바닥글 이미지(로고, 배너 등)를 찾는다.
+
+    크기와 무관하게 같은 xref가 같은 위치에 놓인 경우만 반복으로 보며,
+    세로 중심이 페이지 위/아래 HEADER_FOOTER_BAND 안에 있는 rect만 대상으로 한다.
+
+    Args:
+        page_rects: 페이지별 _collect_image_rects 결과 리스트
+        page_heights: 페이지별 높이 (pt)
+
+    Returns:
+        렌더링을 건너뛸 footprint 집합
+    """
+    pages_by_footprint = defaultdict(set)
+    for page_num, (rects, height) in enumerate(zip(page_rects, page_heights)):
+        top = height * HEADER_FOOTER_BAND
+        bottom = height - top
+        for r in rects:
+            center = (r.y0 + r.y1) / 2
+            if center < top or center > bottom:
+                pages_by_footprint[_footprint(r)].add(page_num)
+
+    threshold = RECURRING_PAGE_RATIO * len(page_rects)
+    return {
+        fp for fp, pages in pages_by_footprint.items()
+        if len(pages) >= 2 and len(pages) > threshold
+    }
+
+
+def _effective_dpi(group, dpi):
+    """그룹 내 래스터의 원본 해상도를 기준으로 렌더링 DPI 상한을 정한다.
+
+    원본보다 높은 DPI로 렌더링하면 업샘플링으로 픽셀만 늘어나므로
+    min(dpi, 최대 원본 DPI × 1.5)로 제한한다 (MIN_ADAPTIVE_DPI 미만으로는 낮추지 않음).
+    """
+    native = 0
+    for r in group:
+        w, h = r.x1 - r.x0, r.y1 - r.y0
+        if w <= 0 or h <= 0:
+            continue
+        pw, ph = r.px_width, r.px_height
+        if abs(pw * h - ph * w) > abs(pw * w - ph * h):  # 90도 회전 배치
+            pw, ph = ph, pw
+        native = max(native, 72 * pw / w, 72 * ph / h)
+    return min(dpi, max(native * ADAPTIVE_DPI_HEADROOM, MIN_ADAPTIVE_DPI))
+
+
+def _is_grayscale(pix):
+    """RGB Pixmap의 모든 픽셀이 R == G == B인지 확인한다."""
+    if pix.n != 3:
+        return pix.n == 1
+    samples = pix.samples
+    red = samples[0::3]
+    return red == samples[1::3] and red == samples[2::3]
+
+
+def _to_colorspace(pix, colorspace):
+    """--colorspace 설정에 따라 Pixmap을 그레이스케일로 변환한다 (원본 Pixmap용)."""
+    if pix.n == 3 and (colorspace == "gray"
+                       or (colorspace == "auto" and _is_grayscale(pix))):
+        return fitz.Pixmap(fitz.csGRAY, pix)
+    return pix
+
+
+def _png_chunk(tag, data):
+    return (struct.pack(">I", len(data)) + tag + data
+            + struct.pack(">I", zlib.crc32(tag + data)))
+
+
+def _encode_png(pix, level=DEFAULT_PNG_LEVEL):
+    """Pixmap을 지정한 zlib 레벨의 PNG 바이트로 인코딩한다.
+
+    pix.tobytes("png")는 압축 레벨을 고를 수 없어 큰 Pixmap에서 인코딩이
+    렌더링만큼 오래 걸리므로, 필터 없이 행을 이어 붙여 zlib으로 직접 압축한다.
+    알파 없는 Gray/RGB Pixmap만 지원한다 (렌더링은 alpha=False, 원본은 알파 이미지 제외).
+    """
+    if pix.alpha or pix.n not in _PNG_COLOR_TYPES:
+        raise ValueError(f"알파 없는 Gray/RGB Pixmap만 인코딩할 수 있습니다 (n={pix.n}, alpha={pix.alpha})")
+    width, height, stride = pix.width, pix.height, pix.stride
+    samples = pix.samples
+    raw = b"".join(
+        b"\x00" + samples[i:i + stride] for i in range(0, height * stride, stride)
+    )
+    header = struct.pack(">IIBBBBB", width, height, 8, _PNG_COLOR_TYPES[pix.n], 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + _png_chunk(b"IHDR", header)
+            + _png_chunk(b"IDAT", zlib.compress(raw, level))
+            + _png_chunk(b"IEND", b""))
+
+
+def _native_pixmap(page, r, mat):
+    """단일 래스터 이미지의 원본 해상도가 렌더링 해상도 이상이면 원본 Pixmap을 반환한다.
+
+    소프트 마스크나 알파 채널(투명도)이 있거나 회전 배치된 이미지, 해상도가 부족한 이미지는
+    None을 반환하여 페이지 렌더링으로 처리하게 한다.
+    """
+    if r.smask or r.x1 <= r.x0 or r.y1 <= r.y0:
+        return None
+    rect_w, rect_h = r.x1 - r.x0, r.y1 - r.y0
+    # 90도 회전 배치는 bbox 종횡비가 원본과 뒤바뀜
+    if abs(r.px_width * rect_h - r.px_height * rect_w) > 0.01 * r.px_width * rect_h:
+        return None
+    if r.px_width < rect_w * mat.a or r.px_height < rect_h * mat.d:
+        return None
+
+    try:
+        pix = fitz.Pixmap(page.parent, r.xref)
+        # JPX 등 이미지 자체에 알파가 있으면 _encode_png로 저장할 수 없으므로 렌더링으로 처리
+        if pix.alpha:
+            return None
+        # Gray/RGB 이외(CMYK, Lab, Separation, DeviceN 등)는 샘플을 그대로 쓸 수 없으므로 RGB로 변환
+        if pix.colorspace is None or pix.colorspace.name not in _PNG_COLORSPACES:
+            pix = fitz.Pixmap(fitz.csRGB, pix)
+    except (RuntimeError, ValueError):
+        return None
+    return pix
+
+
+def _extract_page(page, page_num, rects, basename, mat, gap_threshold,
+                  caption_search_height, native=False, adaptive_dpi=True, colorspace="rgb",
+                  png_level=DEFAULT_PNG_LEVEL):
+    """한 페이지의 이미지 그룹을 렌더링한다.
+
+    rects는 _collect_image_rects로 미리 수집한 이미지 위치이고,
+    mat은 렌더링 해상도 변환 행렬(문서 단위로 한 번 생성)이다.
+    native이면 단일 래스터 그룹은 원본 이미지를 그대로 쓰고 (겹친 이미지는 제외),
+    adaptive_dpi이면 그룹별로 _effective_dpi까지 해상도를 낮춘다.
+    colorspace가 gray이거나 auto에서 그레이스케일로 판별되면 1채널로 렌더링한다.
+    PNG는 png_level(zlib 0-9)로 인코딩한다.
+
+    Returns:
+        (파일명, PNG 바이트, 가로 픽셀, 세로 픽셀, 조각 수) 튜플 리스트
+    """
+    if not rects:
+        return []
+    page_rect = page.rect
+
+    # y좌표로 정렬 후, 근접한 rect들을 그룹핑
+    # y0 오름차순이므로 그룹 하단(y1)과 bbox는 rect를 추가하며 누적 갱신한다
+    rects = sorted(rects, key=lambda r: (r.y0, r.x0))
+    groups = []
+    first = rects[0]
+    current_group = [first]
+    x0, y0, x1, y1 = first.x0, first.y0, first.x1, first.y1
+
+    for r in rects[1:]:
+        if r.y0 <= y1 + gap_threshold:
+            current_group.append(r)
+            if r.x0 < x0:
+                x0 = r.x0
+            if r.x1 > x1:
+                x1 = r.x1
+            if r.y1 > y1:
+                y1 = r.y1
+        else:
+            groups.append((current_group, (x0, y0, x1, y1)))
+            current_group = [r]
+            x0, y0, x1, y1 = r.x0, r.y0, r.x1, r.y1
+    groups.append((current_group, (x0, y0, x1, y1)))
+
+    # 그룹이 여럿이면 페이지 전체 텍스트를 한 번 뽑아 "그림"이 없는 페이지는
+    # 그룹별 캡션 영역 get_text를 생략 (클립 텍스트는 전체 텍스트의 일부)
+    has_caption_word = len(groups) == 1 or "그림" in page.get_text("text")
+
+    # 각 그룹을 하나의 클립 영역으로 합쳐서 렌더링
+    results = []
+    for gi, (group, (x0, y0, x1, y1)) in enumerate(groups):
+        margin = 5
+        clip = fitz.Rect(x0 - margin, y0 - margin, x1 + margin, y1 + margin)
+        clip = clip & page_rect
+
+        pix = None
+        if native and len(group) == 1 and not group[0].stacked:
+            pix = _native_pixmap(page, group[0], mat)
+            if pix is not None:
+                pix = _to_colorspace(pix, colorspace)
+        if pix is None:
+            group_mat = mat
+            if adaptive_dpi:
+                dpi = mat.a * 72
+                group_dpi = _effective_dpi(group, dpi)
+                if group_dpi < dpi:
+                    group_mat = fitz.Matrix(group_dpi / 72, group_dpi / 72)
+
+            # 그레이스케일이면 1채널(csGRAY)로 렌더링하여 픽셀 데이터와 PNG 인코딩 1/3로
+            cs = fitz.csRGB
+            if colorspace == "gray" or (colorspace == "auto" and _is_grayscale(
+                    page.get_pixmap(matrix=GRAY_PROBE_MATRIX, clip=clip))):
+                cs = fitz.csGRAY
+            pix = page.get_pixmap(matrix=group_mat, clip=clip,
+                                  colorspace=cs, alpha=False)
+
+        # 캡션 찾기: 클립 영역 바로 아래에서 "그림 X.X.X" 패턴 검색
+        caption_rect = fitz.Rect(
+            x0 - 50, y1, x1 + 50, y1 + caption_search_height
+        )
+        caption_rect = caption_rect & page_rect
+        caption_match = None
+        if has_caption_word:
+            caption_text = page.get_text("text", clip=caption_rect).strip()
+            caption_match = _CAPTION_RE.search(caption_text)
+        if caption_match:
+            fig_num = caption_match.group(1)
+            fig_desc = caption_match.group(2).strip()[:40]
+            fig_desc = _SANITIZE_RE.sub('_', fig_desc)
+            fig_desc = fig_desc.strip('_. ')
+            if fig_desc:
+                filename = f"그림_{fig_num}_{fig_desc}.png"
+            else:
+                filename = f"그림_{fig_num}.png"
+        else:
+            # 캡션 없는 경우: PDF파일명_페이지_순번
+            filename = f"{basename}_p{page_num + 1:02d}_{gi + 1:02d}.png"
+
+        results.append((filename, _encode_png(pix, png_level), pix.width, pix.height, len(group)))
+
+    return results
+
+
+def _extract_pages(doc, pages, basename, dpi, **options):
+    """열린 문서에서 (페이지 번호, 이미지 rect 리스트) 목록을 처리한다.
+
+    Yields:
+        (페이지 번호, _extract_page 결과) 튜플
+    """
+    mat = fitz.Matrix(dpi / 72, dpi / 72)
+    for page_num, rects in pages:
+        yield page_num, _extract_page(doc[page_num], page_num, rects, basename, mat, **options)
+
+
+# 페이지 렌더링 워커 프로세스가 열어 둔 문서 (_init_worker에서 프로세스당 한 번 열기)
+_WORKER_DOC = None
 
-    if os.path.exists(config_sh):
+
+def _init_worker(pdf_path):
+    """워커 프로세스 initializer: 작업마다 다시 열지 않도록 PDF를 한 번만 연다."""
+    global _WORKER_DOC
+    _WORKER_DOC = fitz.open(pdf_path)
+
+
+def _extract_pages_worker(pages, basename, dpi, **options):
+    """워커 프로세스용: _init_worker로 열어 둔 문서에서 pages를 처리한다."""
+    return list(_extract_pages(_WORKER_DOC, pages, basename, dpi, **options))
+
+
+def _write_new_file(directory, filename, data):
+    """directory에 filename으로 새 파일을 만들어 data를 쓴다.
+
+    파일명 충돌 시 _2, _3 ... suffix를 붙인다. O_EXCL로 생성하므로
+    존재 확인과 생성 사이의 경합 없이 한 번의 시스템 콜로 판정된다.
+
+    Returns:
+        실제로 저장된 파일 경로
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    name_stem, name_ext = os.path.splitext(filename)
+    filepath = os.path.join(directory, filename)
+    counter = 2
+    while True:
         try:
-            result = subprocess.run(
-                ["bash", "-c", f'source "{config_sh}" && echo "PDF_DIR=$PDF_DIR" && echo "MD_DIR=$MD_DIR" && echo "IMG_DIR=$IMG_DIR"'],
-                capture_output=True, text=True
-            )
-            config = {}
-            for line in result.stdout.strip().split("\n"):
-                if "=" in line:
-                    key, val = line.split("=", 1)
-                    config[key] = val
-            return config
-        except Exception:
-            pass
-    return {}
-
-
-def extract_images_from_pdf(pdf_path, output_dir, dpi=300, min_area=5000,
+            fd = os.open(filepath, flags, 0o666)
+            break
+        except FileExistsError:
+            filepath = os.path.join(directory, f"{name_stem}_{counter}{name_ext}")
+            counter += 1
+
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return filepath
+
+
+def _write_page_results(page_results, task_output_dir, verbose):
+    """(페이지 번호, _extract_page 결과)를 받는 대로 저장하고 경로를 내준다."""
+    for page_num, items in page_results:
+        for filename, data, width, height, fragments in items:
+            filepath = _write_new_file(task_output_dir, filename, data)
+
+            if verbose:
+                print(f"  페이지 {page_num + 1}: {filename} "
+                      f"({width}x{height}, {fragments}개 조각)")
+
+            yield filepath
+
+
+def extract_images_from_doc(doc, basename, output_dir, dpi=300, min_area=5000,
                             gap_threshold=5, caption_search_height=30,
-                            verbose=False):
-    """PDF에서 이미지를 추출한다.
+                            verbose=False, workers=1, native=False,
+                            adaptive_dpi=True, colorspace="rgb",
+                            png_level=DEFAULT_PNG_LEVEL):
+    """이미 열린 fitz.Document에서 이미지를 추출한다.
+
+    split_pdf.split_doc 등 다른 단계와 같은 문서 핸들을 공유할 때 사용한다.
+    doc은 닫지 않으며, 제너레이터가 끝날 때까지 열려 있어야 한다.
 
     Args:
-        pdf_path: PDF 파일 경로
-        output_dir: 이미지 저장 디렉토리 (하위에 PDF명 서브디렉토리 생성)
+        doc: 열린 fitz.Document
+        basename: 출력 서브디렉토리 및 캡션 없는 이미지 파일명 접두어
+        output_dir: 이미지 저장 디렉토리 (하위에 basename 서브디렉토리 생성)
         dpi: 렌더링 해상도
         min_area: 최소 이미지 영역 (이하 로고/아이콘 제외)
         gap_threshold: 이미지 조각 간 간격 허용치 (pt)
         caption_search_height: 캡션 검색 높이 (pt)
         verbose: 상세 출력 여부
-
-    Returns:
-        추출된 이미지 파일 경로 리스트
+        workers: 페이지 렌더링 프로세스 수 (1이면 순차 처리).
+            워커가 파일을 다시 열어야 하므로 doc이 파일에서 열린 경우에만 적용
+        native: 단일 래스터 이미지 그룹은 해상도가 충분하면 렌더링 대신
+            원본 이미지를 저장 (여백과 위에 그려진 벡터 주석은 제외됨)
+        adaptive_dpi: 그룹 내 래스터 원본 해상도가 낮으면 렌더링 DPI를
+            원본의 1.5배(최소 150)로 제한
+        colorspace: "rgb" (기본), "gray" (항상 그레이스케일),
+            "auto" (저해상도 샘플로 그레이스케일 여부를 판별)
+        png_level: PNG zlib 압축 레벨 (0-9, 낮을수록 빠르고 파일이 큼)
+
+    Yields:
+        저장된 이미지 파일 경로 (페이지 순서, 저장 직후)
     """
-    doc = fitz.open(pdf_path)
-    basename = os.path.splitext(os.path.basename(pdf_path))[0]
+    # 이미지 위치는 한 번만 수집하여 로고 판별과 렌더링에서 공유
+    page_rects = [_collect_image_rects(page, min_area) for page in doc]
+    # 반복 로고/배너는 그룹핑 전에 제외 (렌더링 자체를 생략)
+    skip_footprints = _find_recurring_logos(
+        page_rects, [page.rect.height for page in doc])
+    if skip_footprints:
+        page_rects = [[r for r in rects if _footprint(r) not in skip_footprints]
+                      for rects in page_rects]
+    pages = [(page_num, rects) for page_num, rects in enumerate(page_rects) if rects]
+    options = dict(
+        dpi=dpi, gap_threshold=gap_threshold,
+        caption_search_height=caption_search_height, native=native,
+        adaptive_dpi=adaptive_dpi, colorspace=colorspace,
+        png_level=png_level,
+    )
 
     # 이미지 파일명 충돌 방지: images/<task_name>/ 서브디렉토리 사용
     task_output_dir = os.path.join(output_dir, basename)
     os.makedirs(task_output_dir, exist_ok=True)
-    extracted = []
 
-    for page_num in range(len(doc)):
-        page = doc[page_num]
-        images = page.get_images(full=True)
-        if not images:
-            continue
+    # 렌더링은 워커에서 병렬로, 파일 쓰기는 페이지 순서대로 여기서 수행
+    if workers > 1 and len(pages) > PAGES_PER_TASK and os.path.isfile(doc.name or ""):
+        blocks = [
+            pages[start:start + PAGES_PER_TASK]
+            for start in range(0, len(pages), PAGES_PER_TASK)
+        ]
+        worker = functools.partial(
+            _extract_pages_worker, basename=basename, **options
+        )
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(doc.name,)) as executor:
+            # map은 완료된 블록부터 순서대로 내주므로 전체 완료를 기다리지 않는다
+            for block in executor.map(worker, blocks):
+                yield from _write_page_results(block, task_output_dir, verbose)
+    else:
+        yield from _write_page_results(
+            _extract_pages(doc, pages, basename, **options), task_output_dir, verbose)
 
-        # 각 이미지의 위치(rect) 수집 (로고 크기 제외)
-        rects = []
-        for img in images:
-            xref = img[0]
-            img_rects = page.get_image_rects(xref)
-            for r in img_rects:
-                area = r.width * r.height
-                if area < min_area:
-                    continue
-                rects.append(r)
-
-        if not rects:
-            continue
 
-        # y좌표로 정렬 후, 근접한 rect들을 그룹핑
-        rects.sort(key=lambda r: (r.y0, r.x0))
-        groups = []
-        current_group = [rects[0]]
+def extract_images_from_pdf(pdf_path, output_dir, **options):
+    """PDF에서 이미지를 추출한다.
 
-        for i in range(1, len(rects)):
-            prev_bottom = max(r.y1 for r in current_group)
-            if rects[i].y0 <= prev_bottom + gap_threshold:
-                current_group.append(rects[i])
-            else:
-                groups.append(current_group)
-                current_group = [rects[i]]
-        groups.append(current_group)
-
-        # 각 그룹을 하나의 클립 영역으로 합쳐서 렌더링
-        for gi, group in enumerate(groups):
-            x0 = min(r.x0 for r in group)
-            y0 = min(r.y0 for r in group)
-            x1 = max(r.x1 for r in group)
-            y1 = max(r.y1 for r in group)
-
-            margin = 5
-            clip = fitz.Rect(x0 - margin, y0 - margin, x1 + margin, y1 + margin)
-            clip = clip & page.rect
-
-            mat = fitz.Matrix(dpi / 72, dpi / 72)
-            pix = page.get_pixmap(matrix=mat, clip=clip)
-
-            # 캡션 찾기: 클립 영역 바로 아래에서 "그림 X.X.X" 패턴 검색
-            caption_rect = fitz.Rect(
-                x0 - 50, y1, x1 + 50, y1 + caption_search_height
-            )
-            caption_rect = caption_rect & page.rect
-            caption_text = page.get_text("text", clip=caption_rect).strip()
+    Args:
+        pdf_path: PDF 파일 경로
+        output_dir: 이미지 저장 디렉토리 (하위에 PDF명 서브디렉토리 생성)
+        **options: extract_images_from_doc 옵션 (dpi, min_area, workers 등)
 
-            caption_match = re.search(
-                r'그림\s*(\d+[\.\-]\d+[\.\-]\d+)\s*(.*)', caption_text
-            )
-            if caption_match:
-                fig_num = caption_match.group(1)
-                fig_desc = caption_match.group(2).strip()[:40]
-                fig_desc = re.sub(r'[/\\:*?"<>|\n\r]', '_', fig_desc)
-                fig_desc = fig_desc.strip('_. ')
-                if fig_desc:
-                    filename = f"그림_{fig_num}_{fig_desc}.png"
-                else:
-                    filename = f"그림_{fig_num}.png"
-            else:
-                # 캡션 없는 경우: PDF파일명_페이지_순번
-                filename = f"{basename}_p{page_num + 1:02d}_{gi + 1:02d}.png"
-
-            filepath = os.path.join(task_output_dir, filename)
-            # 파일명 충돌 방지: 동일 파일명이 존재하면 _2, _3 ... suffix 추가
-            if os.path.exists(filepath):
-                name_stem, name_ext = os.path.splitext(filename)
-                counter = 2
-                while os.path.exists(filepath):
-                    filepath = os.path.join(task_output_dir, f"{name_stem}_{counter}{name_ext}")
-                    counter += 1
-            pix.save(filepath)
-            extracted.append(filepath)
+    Yields:
+        저장된 이미지 파일 경로
+    """
+    basename = os.path.splitext(os.path.basename(pdf_path))[0]
+    doc = fitz.open(pdf_path)
+    try:
+        yield from extract_images_from_doc(doc, basename, output_dir, **options)
+    finally:
+        doc.close()
 
-            if verbose:
-                print(f"  페이지 {page_num + 1}: {filename} "
-                      f"({pix.width}x{pix.height}, {len(group)}개 조각)")
 
-    doc.close()
-    return extracted
+def _count_extracted(pdf_path, output_dir, **options):
+    """PDF 단위 워커용: 추출하며 저장한 이미지 수만 반환한다 (제너레이터는 피클 불가)."""
+    return sum(1 for _ in extract_images_from_pdf(pdf_path, output_dir, **options))
+
+
+def _list_pdfs(directory):
+    """디렉토리의 PDF 파일 경로를 이름순으로 반환한다.
+
+    glob("*.pdf")와 같이 숨김 파일은 제외하되, 확장자 대소문자는 구분하지 않는다.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(
+                entry.path for entry in entries
+                if not entry.name.startswith(".")
+                and entry.name.lower().endswith(".pdf") and entry.is_file()
+            )
+    except FileNotFoundError:
+        return []
 
 
 def main():
@@ -192,6 +608,26 @@ def main():
         "--dpi", type=int, default=300,
         help="렌더링 해상도 (기본: 300)"
     )
+    parser.add_argument(
+        "--colorspace", choices=COLORSPACES, default="rgb",
+        help="출력 색공간: rgb, gray, auto (그레이스케일 그림은 1채널로 저장, 기본: rgb)"
+    )
+    parser.add_argument(
+        "--png-level", type=int, default=DEFAULT_PNG_LEVEL,
+        help=f"PNG 압축 레벨 0-9 (낮을수록 빠르고 파일이 큼, 기본: {DEFAULT_PNG_LEVEL})"
+    )
+    parser.add_argument(
+        "--fixed-dpi", action="store_true",
+        help="원본 해상도와 무관하게 항상 --dpi로 렌더링 (기본: 저해상도 래스터는 DPI 자동 제한)"
+    )
+    parser.add_argument(
+        "--native", action="store_true",
+        help="단일 래스터 이미지는 렌더링 대신 원본 해상도 그대로 저장 (벡터 주석 제외)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=min(os.cpu_count() or 1, 4),
+        help="병렬 처리 프로세스 수 (기본: min(CPU 수, 4))"
+    )
     parser.add_argument(
         "-v", "--verbose", action="store_true",
         help="상세 출력"
@@ -199,9 +635,16 @@ def main():
 
     args = parser.parse_args()
 
+    if args.workers <= 0:
+        print(f"Error: --workers 값은 양의 정수여야 합니다: {args.workers}", file=sys.stderr)
+        sys.exit(1)
+    if not 0 <= args.png_level <= 9:
+        print(f"Error: --png-level 값은 0-9 범위여야 합니다: {args.png_level}", file=sys.stderr)
+        sys.exit(1)
+
     if args.all:
         pdf_dir = default_pdf_dir
-        pdf_files = sorted(glob.glob(os.path.join(pdf_dir, "*.pdf")))
+        pdf_files = _list_pdfs(pdf_dir)
     elif args.pdf_files:
         pdf_files = args.pdf_files
     else:
@@ -209,25 +652,43 @@ def main():
         sys.exit(1)
 
     os.makedirs(args.output, exist_ok=True)
-    total_extracted = 0
-
-    for i, pdf_path in enumerate(pdf_files):
-        if not os.path.exists(pdf_path):
-            print(f"파일 없음: {pdf_path}", file=sys.stderr)
-            continue
-
-        if args.verbose or len(pdf_files) > 1:
-            print(f"[{i + 1}/{len(pdf_files)}] {os.path.basename(pdf_path)}")
 
-        extracted = extract_images_from_pdf(
-            pdf_path, args.output,
-            dpi=args.dpi, verbose=args.verbose
-        )
-        total_extracted += len(extracted)
+    missing = [p for p in pdf_files if not os.path.exists(p)]
+    for pdf_path in missing:
+        print(f"파일 없음: {pdf_path}", file=sys.stderr)
+    pdf_files = [p for p in pdf_files if os.path.exists(p)]
+
+    # PDF가 하나뿐이면 PDF 단위 대신 페이지 단위로 워커 분산
+    extract = functools.partial(
+        _count_extracted, output_dir=args.output,
+        dpi=args.dpi, verbose=args.verbose, native=args.native,
+        adaptive_dpi=not args.fixed_dpi, colorspace=args.colorspace,
+        png_level=args.png_level,
+        workers=args.workers if len(pdf_files) == 1 else 1
+    )
+    total_extracted = 0
 
-        if (i + 1) % 50 == 0:
-            print(f"  진행: {i + 1}/{len(pdf_files)} PDF, "
-                  f"추출 {total_extracted}개")
+    # PyMuPDF는 렌더링 중 GIL을 잡고 있으므로 스레드가 아닌 프로세스로 PDF 단위 분산
+    if args.workers > 1 and len(pdf_files) > 1:
+        executor = ProcessPoolExecutor(max_workers=args.workers)
+        results = executor.map(extract, pdf_files, chunksize=4)
+    else:
+        executor = None
+        results = map(extract, pdf_files)
+
+    try:
+        for i, pdf_path in enumerate(pdf_files):
+            if args.verbose or len(pdf_files) > 1:
+                print(f"[{i + 1}/{len(pdf_files)}] {os.path.basename(pdf_path)}")
+
+            total_extracted += next(results)
+
+            if (i + 1) % 50 == 0:
+                print(f"  진행: {i + 1}/{len(pdf_files)} PDF, "
+                      f"추출 {total_extracted}개")
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     print(f"\n완료: {len(pdf_files)}개 PDF에서 {total_extracted}개 이미지 추출")
     print(f"저장 위치: {args.output}")
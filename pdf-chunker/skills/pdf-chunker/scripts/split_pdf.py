@@ -19,61 +19,142 @@
 """
 
 import argparse
-import glob
-import math
 import os
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import fitz  # PyMuPDF
 
+# 분할 파일 쓰기 스레드 수 (동시에 쓰기 대기 중인 청크 수 상한도 겸함)
+WRITE_WORKERS = 4
+
+
+def _chunk_bytes(doc, start, end):
+    """doc의 start~end 페이지(0-indexed, 포함)를 새 PDF 바이트로 만든다."""
+    # 청크당 insert_pdf는 한 번뿐이므로 final=True로 graft 맵을 바로 해제
+    new_doc = fitz.open()
+    new_doc.insert_pdf(doc, from_page=start, to_page=end, final=True)
+
+    # 복사된 스트림은 이미 압축 상태이고 미사용 객체도 없으므로
+    # 객체 정리(garbage/clean)와 재압축(deflate)은 생략
+    data = new_doc.tobytes(garbage=0, clean=False, deflate=False)
+    new_doc.close()
+    return data
+
+
+def _write_file(filepath, data):
+    with open(filepath, "wb") as f:
+        f.write(data)
+    return filepath
 
-def split_pdf(pdf_path, output_dir=None, chunk_size=10, verbose=False):
-    """PDF를 chunk_size 페이지씩 분할한다.
+
+def split_doc(doc, basename, output_dir, chunk_size=10, verbose=False):
+    """이미 열린 fitz.Document를 chunk_size 페이지씩 분할 저장한다.
+
+    extract_images.extract_images_from_doc 등 다른 단계와 같은 문서 핸들을
+    공유할 때 사용한다. doc은 닫지 않는다.
 
     Args:
-        pdf_path: PDF 파일 경로
-        output_dir: 출력 디렉토리 (None이면 원본과 같은 디렉토리)
+        doc: 열린 fitz.Document
+        basename: 분할 파일명 접두어 ({basename}_0001-0010.pdf)
+        output_dir: 출력 디렉토리
         chunk_size: 분할 단위 (기본 10)
         verbose: 상세 출력
 
     Returns:
-        생성된 분할 파일 경로 리스트. 분할 불필요시 원본 경로 리스트.
+        생성된 분할 파일 경로 리스트
     """
-    doc = fitz.open(pdf_path)
     total = doc.page_count
+    os.makedirs(output_dir, exist_ok=True)
 
-    if total <= chunk_size:
-        if verbose:
-            print(f"  {total}페이지 - 분할 불필요")
-        doc.close()
-        return [pdf_path]
+    # PyMuPDF는 스레드 안전하지 않으므로 PDF 생성은 순차로,
+    # 디스크 쓰기만 스레드로 넘겨 다음 청크 생성과 겹치게 한다.
+    # 디스크가 느려도 청크 바이트가 메모리에 쌓이지 않도록, 쓰기 대기가
+    # WRITE_WORKERS개면 가장 오래된 쓰기가 끝난 뒤 다음 청크를 만든다
+    paths = []
+    with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+        pending = deque()
+        for start in range(0, total, chunk_size):
+            end = min(start + chunk_size, total) - 1
 
-    if output_dir is None:
-        output_dir = os.path.dirname(pdf_path)
-    os.makedirs(output_dir, exist_ok=True)
+            if len(pending) >= WRITE_WORKERS:
+                paths.append(pending.popleft().result())
 
-    basename = os.path.splitext(os.path.basename(pdf_path))[0]
-    num_files = math.ceil(total / chunk_size)
-    created = []
+            data = _chunk_bytes(doc, start, end)
+            filename = f"{basename}_{start + 1:04d}-{end + 1:04d}.pdf"
+            filepath = os.path.join(output_dir, filename)
+            pending.append(executor.submit(_write_file, filepath, data))
 
-    for i in range(num_files):
-        start = i * chunk_size
-        end = min(start + chunk_size - 1, total - 1)
+            if verbose:
+                print(f"  {filename} (페이지 {start + 1}-{end + 1})")
 
-        new_doc = fitz.open()
-        new_doc.insert_pdf(doc, from_page=start, to_page=end)
+        paths.extend(f.result() for f in pending)
+    return paths
 
-        filename = f"{basename}_{start + 1:04d}-{end + 1:04d}.pdf"
-        filepath = os.path.join(output_dir, filename)
-        new_doc.save(filepath)
-        new_doc.close()
-        created.append(filepath)
 
-        if verbose:
-            print(f"  {filename} (페이지 {start + 1}-{end + 1})")
+def split_pdf(pdf_input, output_dir=None, chunk_size=10, verbose=False, basename=None):
+    """PDF를 chunk_size 페이지씩 분할한다.
+
+    Args:
+        pdf_input: PDF 파일 경로, PDF 바이트, 또는 열린 fitz.Document.
+            바이트와 Document는 다시 열지 않고 그대로 사용하며,
+            전달받은 Document는 닫지 않는다.
+        output_dir: 출력 디렉토리 (None이면 원본과 같은 디렉토리)
+        chunk_size: 분할 단위 (기본 10)
+        verbose: 상세 출력
+        basename: 분할 파일명 접두어 (None이면 원본 파일명).
+            파일 경로가 없는 입력(바이트 등)은 output_dir과 함께 필수
 
-    doc.close()
-    return created
+    Returns:
+        생성된 분할 파일 경로 리스트. 분할 불필요시 원본 경로 리스트
+        (원본 파일이 없는 입력이면 빈 리스트).
+    """
+    if isinstance(pdf_input, fitz.Document):
+        doc, own = pdf_input, False
+        pdf_path = doc.name or None
+    elif isinstance(pdf_input, (bytes, bytearray, memoryview)):
+        doc, own = fitz.open(stream=pdf_input, filetype="pdf"), True
+        pdf_path = None
+    else:
+        doc, own = fitz.open(pdf_input), True
+        pdf_path = pdf_input
+
+    try:
+        if doc.page_count <= chunk_size:
+            if verbose:
+                print(f"  {doc.page_count}페이지 - 분할 불필요")
+            return [pdf_path] if pdf_path else []
+
+        if output_dir is None:
+            if pdf_path is None:
+                raise ValueError("파일 경로가 없는 PDF 입력은 output_dir이 필요합니다")
+            output_dir = os.path.dirname(pdf_path)
+        if basename is None:
+            if pdf_path is None:
+                raise ValueError("파일 경로가 없는 PDF 입력은 basename이 필요합니다")
+            basename = os.path.splitext(os.path.basename(pdf_path))[0]
+        return split_doc(doc, basename, output_dir,
+                         chunk_size=chunk_size, verbose=verbose)
+    finally:
+        if own:
+            doc.close()
+
+
+def _list_pdfs(directory):
+    """디렉토리의 PDF 파일 경로를 이름순으로 반환한다.
+
+    glob("*.pdf")와 같이 숨김 파일은 제외하되, 확장자 대소문자는 구분하지 않는다.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(
+                entry.path for entry in entries
+                if not entry.name.startswith(".")
+                and entry.name.lower().endswith(".pdf") and entry.is_file()
+            )
+    except FileNotFoundError:
+        return []
 
 
 def main():
@@ -105,7 +186,7 @@ def main():
 
     # 입력이 폴더인지 파일인지 판단
     if os.path.isdir(args.input):
-        pdf_files = sorted(glob.glob(os.path.join(args.input, "*.pdf")))
+        pdf_files = _list_pdfs(args.input)
         if not pdf_files:
             print(f"폴더에 PDF 파일이 없습니다: {args.input}", file=sys.stderr)
             sys.exit(1)
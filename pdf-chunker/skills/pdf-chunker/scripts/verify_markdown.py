@@ -7,16 +7,26 @@ PDF에서 추출한 텍스트 뭉치(문장/단어)가 마크다운에 포함되
 """
 
 import fitz  # PyMuPDF
+import os
 import re
 import sys
 import argparse
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import List, Set
 
+try:
+    import orjson  # 선택: 대량 검증 결과 JSON 저장 가속
+except ImportError:
+    orjson = None
 
-@dataclass
+
+# 누락 줄마다 생성되는 객체와 결과 객체는 __dict__ 없이 (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class MissingItem:
     """누락된 항목"""
     text: str
@@ -24,7 +34,7 @@ class MissingItem:
     item_type: str  # 'sentence', 'phrase', 'keyword'
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class VerificationReport:
     """검증 결과 리포트"""
     pdf_file: str
@@ -80,6 +90,34 @@ class MarkdownVerifier:
         r'^\d+\s*편\s*부록',          # 머리글 (1 편부록1-7)
         r'^부록\d+-\d+',              # 머리글 (부록1-12-2 ...)
     ]
+    # 줄마다 패턴 16개를 차례로 시도하지 않도록 하나의 alternation으로 미리 컴파일
+    _IGNORE_RE = re.compile('|'.join(f'(?:{p})' for p in IGNORE_PATTERNS))
+
+    _WHITESPACE_RE = re.compile(r'\s+')
+    _WORD_RE = re.compile(r'[가-힣a-zA-Z0-9]+')
+
+    # _strip_markdown 치환 규칙 (순서대로 적용)
+    # 앞 규칙의 결과에 다음 규칙이 다시 적용되므로(예: **굵게 _기울임_**) 하나의 정규식으로 합치지 않음
+    _MARKDOWN_SUBS = [
+        # 이미지/링크
+        (re.compile(r'!\[([^\]]*)\]\([^)]+\)'), r'\1'),
+        (re.compile(r'\[([^\]]+)\]\([^)]+\)'), r'\1'),
+        # 굵게/기울임
+        (re.compile(r'\*\*([^*]+)\*\*'), r'\1'),
+        (re.compile(r'\*([^*]+)\*'), r'\1'),
+        (re.compile(r'__([^_]+)__'), r'\1'),
+        (re.compile(r'_([^_]+)_'), r'\1'),
+        # 코드
+        (re.compile(r'`([^`]+)`'), r'\1'),
+        # 제목/목록 마크
+        (re.compile(r'^#{1,6}\s+', re.MULTILINE), ''),
+        (re.compile(r'^\s*[-*+]\s+', re.MULTILINE), ''),
+        # 표 구분자 (수평선 ---도 여기서 함께 제거됨)
+        (re.compile(r'\|'), ' '),
+        (re.compile(r'^[-:]+$', re.MULTILINE), ''),
+        # HTML 주석
+        (re.compile(r'<!--.*?-->', re.DOTALL), ''),
+    ]
 
     def __init__(self, base_dir: str):
         self.base_dir = Path(base_dir)
@@ -94,55 +132,52 @@ class MarkdownVerifier:
             List of (text, page_num, chunk_type) tuples
         """
         chunks = []
-        doc = fitz.open(pdf_path)
-
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            text = page.get_text("text")
+        # 파일을 한 번에 메모리로 읽어 열고 (페이지마다 파일을 다시 읽지 않음),
+        # with 블록으로 예외가 나도 문서를 닫아 페이지 리소스가 남지 않게 함
+        with fitz.open(stream=Path(pdf_path).read_bytes(), filetype="pdf") as doc:
+            for page_num, page in enumerate(doc):
+                chunks.extend(self._page_chunks(page.get_text("text"), page_num + 1))
+        return chunks
 
-            # 줄 단위로 분리
-            lines = text.split('\n')
+    def _page_chunks(self, text: str, page_num: int) -> List[tuple]:
+        """페이지 텍스트를 줄 단위 (text, page_num, chunk_type) 목록으로 변환"""
+        chunks = []
 
-            for line in lines:
-                line = line.strip()
+        # 줄 단위로 분리
+        lines = text.split('\n')
 
-                # 빈 줄 무시
-                if not line:
-                    continue
+        for line in lines:
+            line = line.strip()
 
-                # 무시할 패턴 체크
-                if self._should_ignore(line):
-                    continue
+            # 빈 줄, 너무 짧은 텍스트 (1-2자) 무시 (단독 글자는 레이아웃 문제)
+            # 정규식보다 싼 길이 검사를 먼저 수행
+            if len(line) <= 2:
+                continue
 
-                # 너무 짧은 텍스트 (1-2자)는 키워드로 분류
-                if len(line) <= 2:
-                    # 단독 글자는 무시 (레이아웃 문제)
-                    continue
+            # 무시할 패턴 체크
+            if self._should_ignore(line):
+                continue
 
-                # 문장인지 구문인지 판단
-                if len(line) > 20:
-                    chunk_type = 'sentence'
-                elif len(line) > 5:
-                    chunk_type = 'phrase'
-                else:
-                    chunk_type = 'keyword'
+            # 문장인지 구문인지 판단
+            if len(line) > 20:
+                chunk_type = 'sentence'
+            elif len(line) > 5:
+                chunk_type = 'phrase'
+            else:
+                chunk_type = 'keyword'
 
-                chunks.append((line, page_num + 1, chunk_type))
+            chunks.append((line, page_num, chunk_type))
 
-        doc.close()
         return chunks
 
     def _should_ignore(self, text: str) -> bool:
         """무시해야 할 텍스트인지 확인"""
-        for pattern in self.IGNORE_PATTERNS:
-            if re.match(pattern, text):
-                return True
-        return False
+        return self._IGNORE_RE.match(text) is not None
 
     def normalize_text(self, text: str) -> str:
         """텍스트 정규화 (비교용)"""
         # 공백 정규화
-        text = re.sub(r'\s+', ' ', text)
+        text = self._WHITESPACE_RE.sub(' ', text)
         text = text.strip()
 
         # 전각 문자를 반각으로
@@ -161,7 +196,7 @@ class MarkdownVerifier:
     def extract_words(self, text: str) -> List[str]:
         """텍스트에서 순수 단어만 추출 (특수문자 제거, 1글자 제외)"""
         # 한글, 영문, 숫자만 단어로 인식, 2글자 이상만
-        return [w for w in re.findall(r'[가-힣a-zA-Z0-9]+', text.lower()) if len(w) >= 2]
+        return [w for w in self._WORD_RE.findall(text.lower()) if len(w) >= 2]
 
     def make_trigrams(self, words: List[str]) -> List[str]:
         """연속 3단어 조합(trigram) 생성"""
@@ -181,33 +216,8 @@ class MarkdownVerifier:
 
     def _strip_markdown(self, text: str) -> str:
         """마크다운 문법 제거"""
-        # 이미지/링크
-        text = re.sub(r'!\[([^\]]*)\]\([^)]+\)', r'\1', text)
-        text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)
-
-        # 굵게/기울임
-        text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)
-        text = re.sub(r'\*([^*]+)\*', r'\1', text)
-        text = re.sub(r'__([^_]+)__', r'\1', text)
-        text = re.sub(r'_([^_]+)_', r'\1', text)
-
-        # 코드
-        text = re.sub(r'`([^`]+)`', r'\1', text)
-
-        # 제목/목록 마크
-        text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
-        text = re.sub(r'^\s*[-*+]\s+', '', text, flags=re.MULTILINE)
-
-        # 표 구분자
-        text = re.sub(r'\|', ' ', text)
-        text = re.sub(r'^[-:]+$', '', text, flags=re.MULTILINE)
-
-        # 수평선
-        text = re.sub(r'^---+$', '', text, flags=re.MULTILINE)
-
-        # HTML 주석
-        text = re.sub(r'<!--.*?-->', '', text, flags=re.DOTALL)
-
+        for pattern, repl in self._MARKDOWN_SUBS:
+            text = pattern.sub(repl, text)
         return text
 
     def verify(self, pdf_path: Path, md_path: Path) -> VerificationReport:
@@ -233,14 +243,12 @@ class MarkdownVerifier:
             if len(words) < 3:
                 continue
 
-            trigrams = self.make_trigrams(words)
-            if not trigrams:
-                continue
-
             report.total_chunks += 1
 
             # trigram 중 하나라도 마크다운에 있으면 포함된 것으로 판정
-            found = any(t in md_trigrams for t in trigrams)
+            # 대부분의 줄은 앞쪽 trigram에서 바로 찾으므로 목록을 만들지 않고 하나씩 생성해 검사
+            found = any(f"{words[i]} {words[i+1]} {words[i+2]}" in md_trigrams
+                        for i in range(len(words) - 2))
 
             if found:
                 report.found_chunks += 1
@@ -295,8 +303,11 @@ class MarkdownVerifier:
         self.print_report(report, verbose)
         return report
 
-    def verify_all(self, verbose: bool = False) -> List[VerificationReport]:
-        """모든 파일 검증"""
+    def verify_all(self, verbose: bool = False, workers: int = 1) -> List[VerificationReport]:
+        """모든 파일 검증
+
+        workers > 1이면 파일 쌍을 프로세스 풀에 분산 (진행 출력·결과 순서는 순차 실행과 동일)
+        """
         reports = []
         md_files = sorted(self.md_dir.glob("*.md"))
 
@@ -306,19 +317,33 @@ class MarkdownVerifier:
 
         print(f"총 {len(md_files)}개 마크다운 파일 검증 시작\n")
 
-        for i, md_path in enumerate(md_files, 1):
-            pdf_path = self.pdf_dir / f"{md_path.stem}.pdf"
-
-            if not pdf_path.exists():
-                print(f"[{i}/{len(md_files)}] {md_path.name}: PDF 없음")
-                continue
+        pairs = [(self.pdf_dir / f"{md_path.stem}.pdf", md_path) for md_path in md_files]
+        jobs = [(pdf_path, md_path) for pdf_path, md_path in pairs if pdf_path.exists()]
+
+        # 파일 쌍마다 독립적인 PyMuPDF 추출 + 정규식 작업이므로 프로세스로 분산
+        # executor.map은 제출 순서대로 결과를 내므로 아래 루프에서 순서대로 하나씩 꺼냄
+        executor = None
+        if workers > 1 and len(jobs) > 1:
+            executor = ProcessPoolExecutor(max_workers=min(workers, len(jobs)))
+            results = executor.map(_verify_pair, *zip(*jobs))
+        else:
+            results = (self.verify(pdf_path, md_path) for pdf_path, md_path in jobs)
+
+        try:
+            for i, (pdf_path, md_path) in enumerate(pairs, 1):
+                if not pdf_path.exists():
+                    print(f"[{i}/{len(md_files)}] {md_path.name}: PDF 없음")
+                    continue
 
-            print(f"[{i}/{len(md_files)}] 검증 중: {md_path.name}")
-            report = self.verify(pdf_path, md_path)
-            reports.append(report)
+                print(f"[{i}/{len(md_files)}] 검증 중: {md_path.name}")
+                report = next(results)
+                reports.append(report)
 
-            status = "OK" if report.coverage_rate >= 90 else "확인필요"
-            print(f"  → 커버리지: {report.coverage_rate:.1f}%, 누락의심: {len(report.missing_items)}개 [{status}]")
+                status = "OK" if report.coverage_rate >= 90 else "확인필요"
+                print(f"  → 커버리지: {report.coverage_rate:.1f}%, 누락의심: {len(report.missing_items)}개 [{status}]")
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
 
         # 요약
         print(f"\n{'='*60}")
@@ -343,12 +368,23 @@ class MarkdownVerifier:
             'reports': [r.to_dict() for r in reports]
         }
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            Path(output_path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
 
         print(f"\n검증 결과 저장: {output_path}")
 
 
+def _verify_pair(pdf_path: Path, md_path: Path) -> VerificationReport:
+    """파일 쌍 하나를 검증 (verify_all 병렬 처리 시 워커 프로세스에서 호출)
+
+    verify()는 base_dir를 쓰지 않으므로 빈 경로로 검증기를 만든다.
+    """
+    return MarkdownVerifier("").verify(pdf_path, md_path)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='PDF 텍스트가 마크다운에 포함되어 있는지 검증합니다.',
@@ -366,6 +402,9 @@ def main():
 
   # JSON으로 결과 저장
   python verify_markdown.py --all --export report.json
+
+  # 병렬 처리 (8 프로세스)
+  python verify_markdown.py --all --workers 8
         """
     )
 
@@ -375,9 +414,15 @@ def main():
     parser.add_argument('--base-dir', default=None, help='기본 디렉토리 경로')
     parser.add_argument('-v', '--verbose', action='store_true', help='상세 출력')
     parser.add_argument('--export', metavar='FILE', help='검증 결과를 JSON 파일로 저장')
+    parser.add_argument('--workers', type=int, default=min(os.cpu_count() or 1, 4),
+                        help='--all 검증 시 병렬 프로세스 수 (기본: min(CPU 수, 4))')
 
     args = parser.parse_args()
 
+    if args.workers <= 0:
+        print(f"Error: --workers 값은 양의 정수여야 합니다: {args.workers}", file=sys.stderr)
+        sys.exit(1)
+
     if args.base_dir:
         base_dir = Path(args.base_dir)
     else:
@@ -386,7 +431,7 @@ def main():
     verifier = MarkdownVerifier(base_dir)
 
     if args.all:
-        reports = verifier.verify_all(verbose=args.verbose)
+        reports = verifier.verify_all(verbose=args.verbose, workers=args.workers)
         if args.export and reports:
             verifier.export_report(reports, Path(args.export))
     elif args.pdf_path and args.md_path:
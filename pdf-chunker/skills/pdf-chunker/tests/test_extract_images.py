@@ -0,0 +1,127 @@
+"""extract_images.py 테스트: 같은 위치에 겹쳐 그려진 이미지 처리"""
+
+import os
+import sys
+
+import fitz
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+import extract_images  # noqa: E402
+
+FIGURE_RECT = fitz.Rect(100, 100, 400, 400)  # 300pt
+
+
+def _solid_pixmap(size, value):
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, size, size), False)
+    pix.clear_with(value)
+    return pix
+
+
+@pytest.fixture(params=[(50, 2000), (2000, 50)], ids=["small-first", "large-first"])
+def stacked_page(request):
+    """같은 300pt rect에 50px와 2000px 이미지를 순서대로 겹쳐 그린 페이지"""
+    doc = fitz.open()
+    page = doc.new_page()
+    for size, value in zip(request.param, (64, 192)):
+        page.insert_image(FIGURE_RECT, pixmap=_solid_pixmap(size, value))
+    yield page
+    doc.close()
+
+
+def test_stacked_images_keep_largest_raster(stacked_page):
+    rects = extract_images._collect_image_rects(stacked_page, min_area=5000)
+
+    assert len(rects) == 1
+    rect = rects[0]
+    assert (rect.px_width, rect.px_height) == (2000, 2000)
+    assert rect.stacked
+    # 작은 이미지 기준(50px → 150 DPI 하한)으로 해상도가 낮아지지 않음
+    assert extract_images._effective_dpi(rects, 300) == 300
+
+
+def test_stacked_images_skip_native(stacked_page, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("겹친 이미지에 원본 저장 경로를 사용함")
+
+    monkeypatch.setattr(extract_images, "_native_pixmap", fail)
+    rects = extract_images._collect_image_rects(stacked_page, min_area=5000)
+    mat = fitz.Matrix(300 / 72, 300 / 72)
+
+    results = extract_images._extract_page(
+        stacked_page, 0, rects, "doc", mat, gap_threshold=5,
+        caption_search_height=30, native=True)
+
+    assert len(results) == 1
+    _, _, width, height, fragments = results[0]
+    clip = (FIGURE_RECT + (-5, -5, 5, 5)) & stacked_page.rect
+    # 원본(2000px)도, 150 DPI로 낮춘 렌더링도 아닌 300 DPI 클립 렌더링
+    expected = (clip * mat).irect
+    assert (width, height) == (expected.width, expected.height)
+    assert fragments == 1
+
+
+def test_single_image_is_not_stacked():
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_image(FIGURE_RECT, pixmap=_solid_pixmap(2000, 128))
+
+    rects = extract_images._collect_image_rects(page, min_area=5000)
+
+    assert len(rects) == 1
+    assert not rects[0].stacked
+    doc.close()
+
+
+@pytest.mark.parametrize("colorspace", [fitz.csRGB, fitz.csGRAY], ids=["rgb", "gray"])
+def test_encode_png_roundtrip(colorspace):
+    pix = fitz.Pixmap(colorspace, fitz.IRect(0, 0, 7, 5), False)
+    pix.clear_with(77)
+    pix.set_pixel(3, 2, (200, 100, 50)[:colorspace.n])
+
+    decoded = fitz.Pixmap(extract_images._encode_png(pix))
+
+    assert (decoded.width, decoded.height, decoded.n) == (7, 5, colorspace.n)
+    assert decoded.samples == pix.samples
+
+
+def test_encode_png_rejects_alpha():
+    # MuPDF 샘플은 premultiplied라 그대로 PNG 알파로 쓰면 반투명 픽셀이 어두워짐
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 2, 2), True)
+
+    with pytest.raises(ValueError):
+        extract_images._encode_png(pix)
+
+
+# (ColorSpace 배열, 성분 수): 샘플을 Gray/RGB로 그대로 쓸 수 없는 색공간
+SPECIAL_COLORSPACES = {
+    "lab": ("[/Lab << /WhitePoint [0.9505 1 1.089] /Range [-100 100 -100 100] >>]", 3),
+    "separation": ("[/Separation /Spot /DeviceCMYK << /FunctionType 2 /Domain [0 1] "
+                   "/C0 [0 0 0 0] /C1 [0 1 1 0] /N 1 >>]", 1),
+    "devicen": ("[/DeviceN [/A /B] /DeviceCMYK {func} 0 R]", 2),
+}
+
+
+@pytest.mark.parametrize("name", sorted(SPECIAL_COLORSPACES))
+def test_native_pixmap_converts_special_colorspaces(name):
+    colorspace, n = SPECIAL_COLORSPACES[name]
+    doc = fitz.open()
+    page = doc.new_page()
+    if "{func}" in colorspace:
+        func = doc.get_new_xref()
+        doc.update_object(func, "<< /FunctionType 4 /Domain [0 1 0 1] /Range [0 1 0 1 0 1 0 1] >>")
+        doc.update_stream(func, b"{ 0 0 }")
+        colorspace = colorspace.format(func=func)
+    xref = doc.get_new_xref()
+    doc.update_object(xref, "<< /Type /XObject /Subtype /Image /Width 100 /Height 100 "
+                            f"/BitsPerComponent 8 /ColorSpace {colorspace} >>")
+    doc.update_stream(xref, bytes([120, 30, 200][:n]) * 10000)
+    page.insert_image(fitz.Rect(100, 100, 124, 124), xref=xref)
+    rects = extract_images._collect_image_rects(page, min_area=0)
+
+    pix = extract_images._native_pixmap(page, rects[0], fitz.Matrix(1, 1))
+
+    assert pix.colorspace.name == "DeviceRGB"
+    assert fitz.Pixmap(extract_images._encode_png(pix)).samples == pix.samples
+    doc.close()
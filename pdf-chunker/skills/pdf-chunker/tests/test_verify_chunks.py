@@ -0,0 +1,180 @@
+"""verify_chunks.py 테스트"""
+
+import copy
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+import verify_chunks  # noqa: E402
+
+
+def _valid_chunk(chunk_type="section"):
+    """스키마 에러/경고가 하나도 없는 청크"""
+    chunk = {
+        "id": "c1", "chunk_id": "c1", "doc_id": "d", "section_index": 0, "chunk_seq": 1,
+        "section_id": "s1", "chunk_type": chunk_type, "section_path": ["1 편", "1 장"],
+        "section_title": "일반", "page_start": 1, "page_end": 2,
+        "locators": {"spans": [{
+            "source_pdf": "doc.pdf", "pdf_page_start": 1, "pdf_page_end": 2,
+            "doc_page_start": 1, "doc_page_end": 2,
+        }]},
+        "context_prefix": "", "text": "선체 구조는 규칙에 따른다.",
+        "split": {"group_id": "g1", "split_index": 0, "split_total": 2, "logical_range": "101."},
+        "prev_chunk_id": None, "next_chunk_id": "c2",
+        "images": [], "tables": [],
+        "tables_data": {"t1": {"title": "표 1", "columns": ["a"], "rows": [["1"]]}},
+        "references": [{"target": "2 장", "type": "internal", "relation": "requires",
+                        "target_norm": {"part": 1}}],
+        "equations": [{"name": "e", "symbol": "t", "expression": "t = 1"}],
+        "keywords": ["선체"],
+        "ontology_keywords": [{"mention": "선체", "type": "structural_member"}],
+        "domain_entities": [{"mention": "강재", "canonical": "steel", "type": "material"}],
+        "applicability": {"ship_type": "all"},
+        "normative_values": [{"value": 1}],
+    }
+    if chunk_type == "table":
+        chunk["table_oversized"] = False
+    return chunk
+
+
+# 필드에 대입해 볼 값 (유효/무효 혼합)
+MUTATION_VALUES = [
+    None, 0, 1, -1, 3, False, True, 1.5, "", " ", "\n", "x", "section", "table", "internal",
+    "requires", "material", [], [1], ["a"], [{}], {}, {"a": None}, {"a": 1},
+    [{"mention": "a", "type": "material"}], [{"mention": "a", "canonical": "b", "type": ""}],
+    [{"name": "a", "symbol": "b", "expression": "c"}],
+    {"t": {"title": 1, "columns": 2, "rows": 3}}, {"t": "str"}, {"t": {}},
+    {"spans": []}, {"spans": [1]}, {"spans": [{"source_pdf": "a"}]},
+    {"group_id": "g", "split_index": 3, "split_total": 1, "logical_range": "x"},
+    {"group_id": "g", "split_index": 0, "split_total": 1},
+    [{"target": "a", "type": 0}], [{"target": "a", "type": "zzz", "relation": "bad"}],
+    [{"target": "a", "type": "external", "relation": None, "target_norm": {"a": None}}],
+]
+
+_FIELDS = sorted(set(_valid_chunk("table")) | {"embedding"})
+
+
+def _mutations():
+    """유효 청크에서 필드 하나를 지우거나 바꾸거나, 중첩 항목 하나를 바꾼 청크들"""
+    for chunk_type in ("section", "table"):
+        base = _valid_chunk(chunk_type)
+        yield base
+        for fld in _FIELDS:
+            chunk = copy.deepcopy(base)
+            chunk.pop(fld, None)
+            yield chunk
+            for value in MUTATION_VALUES:
+                chunk = copy.deepcopy(base)
+                chunk[fld] = copy.deepcopy(value)
+                yield chunk
+            sub = base.get(fld)
+            if isinstance(sub, dict) and sub:
+                sub = next(iter(sub.values())) if fld == "tables_data" else sub
+            elif isinstance(sub, list) and sub and isinstance(sub[0], dict):
+                sub = sub[0]
+            else:
+                continue
+            if fld == "locators":
+                sub = sub["spans"][0]
+            for key in list(sub):
+                for value in [None] + MUTATION_VALUES[:12]:
+                    chunk = copy.deepcopy(base)
+                    target = chunk[fld]
+                    if fld == "tables_data":
+                        target = next(iter(target.values()))
+                    elif fld == "locators":
+                        target = target["spans"][0]
+                    elif isinstance(target, list):
+                        target = target[0]
+                    if value is None:
+                        del target[key]
+                    else:
+                        target[key] = copy.deepcopy(value)
+                    yield chunk
+
+    # 여러 필드를 함께 바꾼 경우
+    rng = random.Random(0)
+    for _ in range(3000):
+        chunk = _valid_chunk(rng.choice(("section", "table")))
+        for _ in range(rng.randint(2, 4)):
+            fld = rng.choice(_FIELDS)
+            if rng.random() < 0.2:
+                chunk.pop(fld, None)
+            else:
+                chunk[fld] = copy.deepcopy(rng.choice(MUTATION_VALUES))
+        yield chunk
+
+
+def _schema_errors(chunk):
+    report = verify_chunks.VerificationReport(json_file="x")
+    try:
+        verify_chunks.ChunkVerifier()._check_chunk_schema(chunk, report)
+    except Exception as e:  # 필드별 검사가 예외를 내면 게이트 경로도 같은 예외여야 함
+        return ("exception", type(e).__name__)
+    return report.schema_errors
+
+
+def test_clean_chunk_schema_matches_field_checks(monkeypatch):
+    """CLEAN_CHUNK_SCHEMA 게이트를 거친 결과가 필드별 검사만 한 결과와 같은지"""
+    pytest.importorskip("fastjsonschema")
+    gate = verify_chunks._is_clean_chunk
+    assert gate(_valid_chunk()) and gate(_valid_chunk("table"))
+
+    clean = 0
+    for chunk in _mutations():
+        gated = _schema_errors(chunk)
+        monkeypatch.setattr(verify_chunks, "_is_clean_chunk", None)
+        unchecked = _schema_errors(chunk)
+        monkeypatch.setattr(verify_chunks, "_is_clean_chunk", gate)
+
+        assert gated == unchecked, chunk
+        clean += gate(chunk)
+    # 게이트가 실제로 쓰였는지 (모두 unclean이면 비교가 무의미)
+    assert clean > 100
+
+
+def _linked_chunks(ids):
+    """ids 순서대로 chunk_seq를 매기고 prev/next_chunk_id를 이어 붙인 청크 목록"""
+    chunks = []
+    for i, cid in enumerate(ids):
+        chunk = _valid_chunk()
+        chunk.update(id=cid, chunk_id=cid, chunk_seq=i + 1, split=None,
+                     prev_chunk_id=ids[i - 1] if i > 0 else None,
+                     next_chunk_id=ids[i + 1] if i + 1 < len(ids) else None)
+        chunks.append(chunk)
+    return chunks
+
+
+def _link_mismatches(chunks):
+    report = verify_chunks.VerificationReport(json_file="x")
+    verify_chunks.ChunkVerifier().verify_structure({"chunks": chunks}, report)
+    return [(e.error_type, e.severity) for e in report.structure_errors
+            if e.error_type.endswith("_chunk_id_mismatch")]
+
+
+def test_chunk_links_in_order_have_no_mismatch():
+    assert _link_mismatches(_linked_chunks(["c1", "c2", "c3", "c4"])) == []
+
+
+def test_reordered_chunk_links_warn():
+    chunks = _linked_chunks(["c1", "c2", "c3", "c4"])
+    # c3이 c1을, c1이 c3을 가리킴 (둘 다 존재하는 id지만 인접 청크가 아님)
+    chunks[2]["prev_chunk_id"] = "c1"
+    chunks[0]["next_chunk_id"] = "c3"
+
+    assert _link_mismatches(chunks) == [
+        ("next_chunk_id_mismatch", "warning"),
+        ("prev_chunk_id_mismatch", "warning"),
+    ]
+
+
+def test_duplicate_chunk_id_does_not_trigger_mismatch():
+    # "b"가 2번째와 4번째에 중복: 위치를 특정할 수 없으므로 "b"를 가리키는 링크는 판정하지 않음
+    # (마지막 위치로 판정하면 3번째 청크의 prev "b"가 직전 청크가 아닌 것으로 오판)
+    chunks = _linked_chunks(["a", "b", "c", "b"])
+
+    assert _link_mismatches(chunks) == []